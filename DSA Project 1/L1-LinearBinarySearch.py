@@ -12,7 +12,7 @@ with explicit handling for common edge cases:
 
 Functions:
 - `binary_search(arr, target)` -> int
-    Returns any index where `target` is found, or -1 if not found.
+    Returns an index where `target` is found (the leftmost), or -1 if not found.
 
 - `binary_search_first(arr, target)` -> int
     Returns the first (leftmost) index of `target` in a sorted array, or -1.
@@ -26,110 +26,354 @@ Functions:
 - `linear_search_all(arr, target)` -> list[int]
     Returns a list of all indices where `target` occurs (empty if none).
 
+- `binary_search_branchless(arr, target)` -> int
+    Power-of-two step search whose comparison feeds arithmetic instead of a
+    branch; returns the last index of `target`, or -1.
+
+- `binary_search_np(arr_np, target)` -> int
+    NumPy fast path: first index of `target` in a sorted `numpy.ndarray`, or -1.
+
+- `binary_search_all_np(arr_np, target)` -> range
+    NumPy fast path: range of all indices where `target` occurs.
+
+- `binary_search_many_np(arr_np, targets)` -> numpy.ndarray
+    NumPy batch search: leftmost index (or -1) for every target in one call.
+
+- `linear_search_np(arr_np, target)` -> int
+    NumPy fast path: first index of `target`, via a vectorized mask.
+
+- `linear_search_all_np(arr_np, target)` -> list[int]
+    NumPy fast path: all indices where `target` occurs, via a vectorized mask.
+
+- `binary_search_nb(arr, target)` / `linear_search_nb(arr, target)` /
+  `binary_search_branchless_nb(arr, target)` -> int
+    Numba-compiled searches over an int64 view of `arr`.
+
+- `main()`
+    Runs the timing demo and edge-case checks (what `python L1-...py` does).
+
 All functions gracefully handle empty input and single-element arrays.
+`binary_search`, `binary_search_first`, `binary_search_all`,
+`linear_search` and `linear_search_all` dispatch to the NumPy fast paths
+when given a `numpy.ndarray`. NumPy and Numba are optional: the `_np` functions need
+NumPy, and the `_nb` functions run their kernels as plain Python when
+Numba is missing.
 '''
-import time
+import timeit
 import random
+from bisect import bisect_left, bisect_right
+from importlib.util import find_spec
 
-# Example data used later for timing/demo
-unsorted_list = [random.randint(1, 10000) for _ in range(10000)]
-arr1 = sorted(unsorted_list)
-num_to_b_found = arr1[random.randint(0, len(arr1) - 1)]
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
 
 
 def binary_search(arr: list, target: int) -> int:
     """Standard binary search.
 
-    Returns any index where `target` is found (in a sorted array),
-    or -1 if not found. Handles empty arrays.
+    Returns an index where `target` is found (in a sorted array),
+    or -1 if not found. Handles empty arrays. The search is delegated to
+    the C implementation of `bisect_left`, so the index returned is the
+    leftmost occurrence.
     """
-    if not arr:
-        return -1
-    left, right = 0, len(arr) - 1
-    while left <= right:
-        mid = (left + right) // 2
-        if arr[mid] == target:
-            return mid
-        elif arr[mid] < target:
-            left = mid + 1
-        else:
-            right = mid - 1
+    if np is not None and isinstance(arr, np.ndarray):
+        return binary_search_np(arr, target)
+    i = bisect_left(arr, target)
+    if i < len(arr) and arr[i] == target:
+        return i
     return -1
 
 
 def binary_search_first(arr: list, target: int) -> int:
     """Return the first (leftmost) index of `target` in `arr`, or -1.
 
-    Useful when `arr` may contain repeated elements.
+    Useful when `arr` may contain repeated elements. `bisect_left` already
+    lands on the leftmost match, so this shares `binary_search`.
     """
-    if not arr:
-        return -1
-    left, right = 0, len(arr) - 1
-    res = -1
-    while left <= right:
-        mid = (left + right) // 2
-        if arr[mid] == target:
-            res = mid
-            right = mid - 1
-        elif arr[mid] < target:
-            left = mid + 1
-        else:
-            right = mid - 1
-    return res
+    return binary_search(arr, target)
 
 
 def binary_search_all(arr: list, target: int) -> list:
     """Return a list of all indices where `target` occurs in the sorted `arr`.
 
     Returns an empty list if `target` is not present.
-    This finds one occurrence then expands left/right to collect the full block
-    (efficient because equal elements are contiguous in a sorted array).
+    The block of equal elements is bounded by `bisect_left`/`bisect_right`,
+    so duplicates cost O(log n) instead of a linear scan over the block.
+    A `numpy.ndarray` goes to `binary_search_all_np`.
     """
-    idx = binary_search(arr, target)
-    if idx == -1:
-        return []
-    l = idx
-    while l - 1 >= 0 and arr[l - 1] == target:
-        l -= 1
-    r = idx
-    while r + 1 < len(arr) and arr[r + 1] == target:
-        r += 1
-    return list(range(l, r + 1))
+    if np is not None and isinstance(arr, np.ndarray):
+        return list(binary_search_all_np(arr, target))
+    l = bisect_left(arr, target)
+    r = bisect_right(arr, target)
+    return list(range(l, r)) if l < r else []
 
 
 def linear_search(arr: list, target: int) -> int:
     """Return the first index of `target` by scanning left-to-right, or -1.
 
-    Works for unsorted arrays and handles empty inputs.
+    Works for unsorted arrays and handles empty inputs. The scan itself is
+    `list.index`, which runs in C; a `numpy.ndarray` goes to `linear_search_np`.
     """
-    for i, v in enumerate(arr):
-        if v == target:
-            return i
-    return -1
+    if np is not None and isinstance(arr, np.ndarray):
+        return linear_search_np(arr, target)
+    try:
+        return arr.index(target)
+    except ValueError:
+        return -1
 
 
 def linear_search_all(arr: list, target: int) -> list:
     """Return all indices where `target` occurs (left-to-right scan).
 
-    Returns an empty list if not found.
+    Returns an empty list if not found. Dispatches to `linear_search_all_np`
+    when given a `numpy.ndarray`.
     """
+    if np is not None and isinstance(arr, np.ndarray):
+        return linear_search_all_np(arr, target)
     return [i for i, v in enumerate(arr) if v == target]
 
 
-if __name__ == "__main__":
-    # Demo: simple timing using the randomly generated sorted array
+def binary_search_branchless(arr, target: int) -> int:
+    """Branchless binary search (Shar's method) over a sorted array.
+
+    Starts from the largest power of two <= len(arr) and halves the step each
+    round, advancing `pos` by `step * (arr[pos + step] <= target)`. The
+    comparison result is used as a number rather than a branch, so once
+    compiled it becomes a conditional move. Returns the last index of
+    `target`, or -1.
+    """
+    n = len(arr)
+    if n == 0:
+        return -1
+    step = 1
+    while step * 2 <= n:
+        step *= 2
+    pos = -1
+    while step:
+        if pos + step < n:
+            pos += step * (arr[pos + step] <= target)
+        step >>= 1
+    if pos >= 0 and arr[pos] == target:
+        return pos
+    return -1
+
+
+def binary_search_np(arr_np, target: int) -> int:
+    """Return the first (leftmost) index of `target` in a sorted ndarray, or -1.
+
+    Delegates the search to `np.searchsorted`, so the whole probe loop runs
+    in C followed by a single equality check.
+    """
+    idx = int(np.searchsorted(arr_np, target, side='left'))
+    if idx < arr_np.size and arr_np[idx] == target:
+        return idx
+    return -1
+
+
+def binary_search_all_np(arr_np, target: int) -> range:
+    """Return a range of all indices where `target` occurs in a sorted ndarray.
+
+    The left and right boundaries come from two `np.searchsorted` calls;
+    the range is empty if `target` is not present.
+    """
+    l = int(np.searchsorted(arr_np, target, side='left'))
+    r = int(np.searchsorted(arr_np, target, side='right'))
+    return range(l, r)
+
+
+def binary_search_many_np(arr_np, targets):
+    """Return the leftmost index of each of `targets` in a sorted ndarray.
+
+    Missing targets get -1. All the searches run in a single
+    `np.searchsorted` call, so for query-heavy workloads (e.g. joins)
+    there is no per-query Python overhead at all.
+    """
+    targets = np.asarray(targets)
+    n = arr_np.size
+    if n == 0:
+        return np.full(targets.shape, -1, dtype=np.int64)
+    idx = np.searchsorted(arr_np, targets, side='left')
+    hit = (idx < n) & (arr_np[np.minimum(idx, n - 1)] == targets)
+    return np.where(hit, idx, -1)
+
+
+def linear_search_np(arr_np, target: int) -> int:
+    """Return the first index of `target` in an ndarray, or -1.
+
+    The equality mask is computed in one vectorized pass.
+    """
+    idx = np.flatnonzero(arr_np == target)
+    return int(idx[0]) if idx.size else -1
+
+
+def linear_search_all_np(arr_np, target: int) -> list:
+    """Return all indices where `target` occurs in an ndarray (empty if none).
+
+    The comparison runs as one vectorized pass and `np.flatnonzero` does the
+    compaction in C. For a plain list of ints, convert once up front (e.g.
+    `np.frombuffer(array.array('q', arr), dtype=np.int64)`) and reuse the
+    array across searches to amortize the conversion.
+    """
+    return np.flatnonzero(arr_np == target).tolist()
+
+
+def _binary_search_kernel(arr, target):
+    left, right = 0, len(arr) - 1
+    while left <= right:
+        mid = (left + right) >> 1
+        v = arr[mid]
+        if v == target:
+            return mid
+        # Both bounds are selected rather than branched on, so once compiled
+        # the unpredictable `v < target` turns into conditional moves
+        go_right = v < target
+        left = mid + 1 if go_right else left
+        right = right if go_right else mid - 1
+    return -1
+
+
+def _linear_search_kernel(arr, target):
+    for i in range(len(arr)):
+        if arr[i] == target:
+            return i
+    return -1
+
+
+_compiled_kernels = {}
+
+
+def _compiled(kernel):
+    """Return the Numba-compiled version of `kernel`, building it on first use.
+
+    Numba is imported and the kernel jitted only when an `_nb` search is
+    first called, so importing this module stays cheap. Without Numba the
+    plain-Python kernel is returned. Compiled kernels are cached on disk, but
+    only when this file runs as a script: the cache records the loading
+    module's name, and this file's hyphenated name can't be imported
+    normally, so for importers (importlib, test runners) it would not
+    round-trip.
+    """
+    compiled = _compiled_kernels.get(kernel)
+    if compiled is None:
+        try:
+            import numba
+        except ImportError:  # Numba is optional
+            compiled = kernel
+        else:
+            compiled = numba.njit('int64(int64[:], int64)', cache=(__name__ == "__main__"),
+                                  boundscheck=False)(kernel)
+        _compiled_kernels[kernel] = compiled
+    return compiled
+
+
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def _int64_args(arr, target):
+    """Return `(arr, target)` ready for the int64 kernels, or None.
+
+    None means the data is not integral (floats, objects, out-of-range ints).
+    Converting it would silently truncate and give wrong answers, so callers
+    fall back to the pure-Python search instead. Without NumPy the kernels
+    are plain Python and the arguments pass through unchanged.
+    """
+    if np is None:
+        return arr, target
+    if isinstance(target, bool) or not isinstance(target, (int, np.integer)):
+        return None
+    if not _INT64_MIN <= target <= _INT64_MAX:
+        return None
+    arr = np.asarray(arr)
+    if arr.size and (arr.dtype.kind not in "iu" or arr.dtype == np.uint64):
+        return None
+    return arr.astype(np.int64, copy=False), target
+
+
+def binary_search_nb(arr, target: int) -> int:
+    """Binary search through the Numba-compiled kernel.
+
+    `arr` is converted to an int64 array once per call (a no-op if it
+    already is one). Non-integer data falls back to `binary_search`.
+    """
+    args = _int64_args(arr, target)
+    if args is None:
+        return binary_search(arr, target)
+    return int(_compiled(_binary_search_kernel)(*args))
+
+
+def linear_search_nb(arr, target: int) -> int:
+    """Linear search through the Numba-compiled kernel.
+
+    Same conversion rules as `binary_search_nb`; non-integer data falls back
+    to `linear_search`.
+    """
+    args = _int64_args(arr, target)
+    if args is None:
+        return linear_search(arr, target)
+    return int(_compiled(_linear_search_kernel)(*args))
+
+
+def binary_search_branchless_nb(arr, target: int) -> int:
+    """`binary_search_branchless` through the Numba-compiled kernel.
+
+    Same conversion rules as `binary_search_nb`; non-integer data runs the
+    pure-Python `binary_search_branchless`.
+    """
+    args = _int64_args(arr, target)
+    if args is None:
+        return binary_search_branchless(arr, target)
+    return int(_compiled(binary_search_branchless)(*args))
+
+
+def main():
+    """Run the timing demo and the edge-case checks."""
+    # Example data used for timing/demo (built here, not at import time)
+    if np is not None:
+        # Generate and sort in C; the list copy feeds the pure-Python searches
+        rng = np.random.default_rng()
+        arr1_np = np.sort(rng.integers(1, 10001, size=10000, dtype=np.int64))
+        arr1 = arr1_np.tolist()
+        num_to_b_found = int(arr1_np[rng.integers(0, arr1_np.size)])
+    else:
+        unsorted_list = [random.randint(1, 10000) for _ in range(10000)]
+        arr1 = sorted(unsorted_list)
+        num_to_b_found = arr1[random.randint(0, len(arr1) - 1)]
+
+    # Demo: timing using the randomly generated sorted array. Each search is
+    # called `number` times per run and the best of `repeat` runs is reported
+    # per call; a single time.time() delta is too coarse for an O(log n) call.
     print("-- Demo: timing on a large random sorted array --")
-    time_start = time.time()
-    result = binary_search(arr1, num_to_b_found)
-    print(f"Binary search: Element found at index: {result}" if result != -1 else "Binary search: Element not found")
-    time_end = time.time()
-    print(f"Time taken for Binary Search: {time_end - time_start} seconds")
-
-    time_start = time.time()
-    result = linear_search(arr1, num_to_b_found)
-    print(f"Linear search: Element found at index: {result}" if result != -1 else "Linear search: Element not found")
-    time_end = time.time()
-    print(f"Time taken for Linear Search: {time_end - time_start} seconds")
+    searches = [
+        ("Binary Search", binary_search, arr1),
+        ("Linear Search", linear_search, arr1),
+    ]
+    if np is not None:
+        searches += [
+            ("NumPy Binary Search", binary_search_np, arr1_np),
+            ("NumPy Linear Search", linear_search_np, arr1_np),
+        ]
+    if find_spec("numba") is not None:
+        # The first call of each includes JIT/cache loading; timeit's
+        # best-of-runs leaves it out
+        searches += [
+            ("Numba Binary Search", binary_search_nb, arr1_np),
+            ("Numba Linear Search", linear_search_nb, arr1_np),
+        ]
+
+    number, repeat = 10000, 5
+    for label, search, arr in searches:
+        result = search(arr, num_to_b_found)
+        print(f"{label}: Element found at index: {result}" if result != -1 else f"{label}: Element not found")
+        best = min(timeit.repeat(lambda: search(arr, num_to_b_found), number=number, repeat=repeat))
+        print(f"Time taken for {label}: {best / number:.3e} seconds per call (best of {repeat} x {number})")
+
+    if np is not None:
+        # Batch variant: all `number` queries in one call
+        queries = np.full(number, num_to_b_found, dtype=np.int64)
+        best = min(timeit.repeat(lambda: binary_search_many_np(arr1_np, queries), number=1, repeat=repeat))
+        print(f"Time taken for NumPy Batch Binary Search: {best / number:.3e} seconds per query (best of {repeat} x 1 batch of {number})")
 
     # Explicit edge-case checks
     print("\n-- Edge-case checks --")
@@ -148,6 +392,20 @@ if __name__ == "__main__":
         print(f"\nTest: {desc} -> arr={arr}, target={t}")
         print("binary_search:", binary_search(arr, t))
         print("binary_search_first:", binary_search_first(arr, t))
+        print("binary_search_branchless:", binary_search_branchless(arr, t))
         print("binary_search_all:", binary_search_all(arr, t))
         print("linear_search:", linear_search(arr, t))
         print("linear_search_all:", linear_search_all(arr, t))
+        if np is not None:
+            arr_np = np.asarray(arr, dtype=np.int64)
+            print("binary_search_np:", binary_search_np(arr_np, t))
+            print("binary_search_all_np:", list(binary_search_all_np(arr_np, t)))
+            print("linear_search_np:", linear_search_np(arr_np, t))
+            print("linear_search_all_np:", linear_search_all_np(arr_np, t))
+            print("binary_search_nb:", binary_search_nb(arr_np, t))
+            print("linear_search_nb:", linear_search_nb(arr_np, t))
+            print("binary_search_branchless_nb:", binary_search_branchless_nb(arr_np, t))
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,7 @@ KEY PERFORMANCE INSIGHTS:
 
 The module includes:
 1. UserDatabase: Simple linear search implementation using dictionary
-2. BSTUserDatabase: Binary Search Tree implementation for user storage
+2. BSTUserDatabase: Binary Search Tree (treap) implementation for user storage
 3. Performance benchmarking suite comparing both approaches
 4. Detailed analysis explaining why BST outperforms linear search
 
@@ -36,70 +36,158 @@ Public API:
 - BSTUserDatabase: Binary search tree implementation  
 - run_performance_tests(): Benchmark both approaches
 - TreeNode, build_tree(), tree_to_tuple(): Tree utilities
+- display_keys(), display_keys_lines(): Rotated tree drawing (printed / as lines)
+- ArrayTree: Heap-indexed (flat list) tree with the same tuple round trip
+
+STORAGE CONTRACTS:
+- BSTUserDatabase keeps a reference to each inserted `user`. `update` changes
+  that object, and changes made to it directly show up in `find_user` and
+  `list_all_users` (after resetting `user._intro`).
+- UserDatabase copies the fields into column lists on insert. `update` only
+  changes its own copy, and later changes to the `user` object are not seen.
+  Its listings format every row on each call instead of reusing `_intro`.
 '''
 
-import time
+import timeit
 import random
 import string
+import sys
+from collections import OrderedDict, deque
 from datetime import datetime
 
 class user:
+    """A user record; `introduce()` caches its formatted string in `_intro`.
+
+    Field writes are plain slot stores with no invalidation hook, so code
+    that changes `username`, `name` or `email` directly must also set
+    `_intro = None`, as `BSTUserDatabase.update` does.
+    """
+    __slots__ = ('username', 'name', 'email', '_intro')
+
     def __init__(self, username, name, email):
         self.username = username
         self.name = name
         self.email = email
+        self._intro = None
 
     def introduce(self):
-        return f"Username: {self.username}, Name: {self.name}, Email: {self.email}"
+        # Formatted once and reused until `_intro` is reset
+        intro = self._intro
+        if intro is None:
+            intro = self._intro = f"Username: {self.username}, Name: {self.name}, Email: {self.email}"
+        return intro
 
     def __repr__(self):
         return f"user(username={self.username!r}, name={self.name!r}, email={self.email!r})"
 
 
+def _intern_key(key):
+    """Intern a stored username key so lookups with an identical string
+    object (literals, keys reused from a previous insert) compare by pointer"""
+    return sys.intern(key) if type(key) is str else key
+
+
 class UserDatabase:
-    """Linear search implementation - O(n) complexity"""
+    """Linear search implementation - O(n) complexity
+
+    Users are stored column-wise: parallel `_usernames`, `_names` and
+    `_emails` lists plus an `_index` dict mapping each normalized username
+    to its row. Inserting copies the user's fields into a new row, so
+    `update` changes the stored email, not the original `user` object.
+    """
     def __init__(self, case_sensitive: bool = True):
-        self._users = {}
+        self._index = {}
+        self._usernames = []
+        self._names = []
+        self._emails = []
         self.case_sensitive = case_sensitive
-
-    def _key(self, username):
-        if username is None:
-            return None
-        return username if self.case_sensitive else username.lower()
+        # Chosen once: None means usernames are used as-is, so the hot paths
+        # skip a function call entirely when case-sensitive
+        self._normalize = None if case_sensitive else str.lower
 
     def insert_user(self, user_obj):
         if user_obj is None:
             return "Invalid user: None provided"
-        if not hasattr(user_obj, 'username') or user_obj.username is None:
+        try:
+            uname = user_obj.username
+        except AttributeError:
             return "Invalid user: username cannot be None"
-        key = self._key(user_obj.username)
-        if key in self._users:
-            return f"Insert failed: username '{user_obj.username}' already exists"
-        self._users[key] = user_obj
-        return f"User {user_obj.username} inserted into database successfully"
+        if uname is None:
+            return "Invalid user: username cannot be None"
+        # Read every field before touching the table, so a user object that
+        # fails here leaves no half-inserted row behind
+        name = user_obj.name
+        email = user_obj.email
+        norm = self._normalize
+        key = uname if norm is None else norm(uname)
+        # One probe: setdefault only stores the new row number if `key` is free
+        row = len(self._usernames)
+        if self._index.setdefault(_intern_key(key), row) != row:
+            return f"Insert failed: username '{uname}' already exists"
+        self._usernames.append(uname)
+        self._names.append(name)
+        self._emails.append(email)
+        return f"User {uname} inserted into database successfully"
+
+    def bulk_insert(self, users):
+        """Insert many users in one pass and return how many were added.
+
+        Same rules as `insert_user` without its per-call overhead or message
+        strings: invalid users and duplicate usernames are skipped (the first
+        occurrence wins).
+        """
+        norm = self._normalize
+        index = self._index
+        usernames, names, emails = self._usernames, self._names, self._emails
+        start = row = len(usernames)
+        for u in users:
+            uname = getattr(u, 'username', None)
+            if uname is None:
+                continue
+            name = u.name
+            email = u.email
+            key = uname if norm is None else norm(uname)
+            if index.setdefault(_intern_key(key), row) != row:
+                continue
+            usernames.append(uname)
+            names.append(name)
+            emails.append(email)
+            row += 1
+        return row - start
+
+    def _lookup(self, username):
+        """Return the row for `username`, or None if absent"""
+        if username is None:
+            return None
+        norm = self._normalize
+        return self._index.get(username if norm is None else norm(username))
 
     def find_user(self, username):
-        if username is None:
+        i = self._lookup(username)
+        if i is None:
             return "User not found"
-        key = self._key(username)
-        u = self._users.get(key)
-        return u.introduce() if u is not None else "User not found"
+        return f"Username: {self._usernames[i]}, Name: {self._names[i]}, Email: {self._emails[i]}"
 
     def update(self, username, new_email):
-        if username is None:
+        i = self._lookup(username)
+        if i is None:
             return "User not found"
-        key = self._key(username)
-        u = self._users.get(key)
-        if u is None:
-            return "User not found"
-        u.email = new_email
-        return f"User {u.username} email updated to {new_email}"
+        self._emails[i] = new_email
+        return f"User {self._usernames[i]} email updated to {new_email}"
 
     def list_all_users(self):
-        return [u.introduce() for u in self._users.values()]
+        return [f"Username: {u}, Name: {n}, Email: {e}"
+                for u, n, e in zip(self._usernames, self._names, self._emails)]
+
+    def iter_all_users(self):
+        """Yield each user's introduction lazily instead of building a list"""
+        for u, n, e in zip(self._usernames, self._names, self._emails):
+            yield f"Username: {u}, Name: {n}, Email: {e}"
 
 
 class TreeNode:
+    __slots__ = ('key', 'left', 'right')
+
     def __init__(self, key):
         self.key = key
         self.left = None
@@ -107,83 +195,244 @@ class TreeNode:
 
 
 class BSTNode:
-    """Node for Binary Search Tree storing user objects"""
-    def __init__(self, user_obj):
+    """Node for Binary Search Tree storing user objects.
+
+    `key` is the normalized username, computed once on insert so traversals
+    compare against it directly instead of re-normalizing at every node.
+    `priority` is a random heap priority used to keep the treap balanced;
+    pass one in to skip drawing it here.
+    """
+    __slots__ = ('user', 'key', 'priority', 'left', 'right')
+
+    def __init__(self, user_obj, key, priority=None):
         self.user = user_obj
+        self.key = key
+        self.priority = random.random() if priority is None else priority
         self.left = None
         self.right = None
 
 
 class BSTUserDatabase:
-    """Binary Search Tree implementation - O(log n) average complexity"""
-    def __init__(self, case_sensitive: bool = True):
+    """Binary Search Tree implementation - O(log n) expected complexity
+
+    The tree is a treap: ordered by key, and heap-ordered on each node's
+    random priority. Rotations on insert keep the expected depth O(log n)
+    whatever order the usernames arrive in.
+
+    Nodes found by `find_user` are kept in a bounded LRU cache of
+    `cache_size` entries so repeated lookups skip the tree descent. The
+    cache holds nodes rather than strings and the text always comes from
+    `user.introduce()`, so resetting `user._intro` is the only invalidation
+    a field change needs.
+    """
+    def __init__(self, case_sensitive: bool = True, cache_size: int = 1024):
         self.root = None
         self.case_sensitive = case_sensitive
+        # Chosen once: None means usernames are used as-is, so the hot paths
+        # skip a function call entirely when case-sensitive
+        self._normalize = None if case_sensitive else str.lower
         self.size = 0
-
-    def _key(self, username):
-        if username is None:
-            return None
-        return username if self.case_sensitive else username.lower()
+        self.cache_size = cache_size
+        self._find_cache = OrderedDict()
 
     def insert_user(self, user_obj):
         if user_obj is None:
             return "Invalid user: None provided"
-        if not hasattr(user_obj, 'username') or user_obj.username is None:
+        try:
+            uname = user_obj.username
+        except AttributeError:
+            return "Invalid user: username cannot be None"
+        if uname is None:
             return "Invalid user: username cannot be None"
         
-        key = self._key(user_obj.username)
-        if self._search(self.root, key) is not None:
-            return f"Insert failed: username '{user_obj.username}' already exists"
+        norm = self._normalize
+        key = uname if norm is None else norm(uname)
+        root = self._insert(self.root, user_obj, key)
+        if root is None:
+            return f"Insert failed: username '{uname}' already exists"
         
-        self.root = self._insert(self.root, user_obj, key)
+        self.root = root
         self.size += 1
-        return f"User {user_obj.username} inserted into database successfully"
+        return f"User {uname} inserted into database successfully"
+
+    def bulk_insert(self, users):
+        """Insert many users at once and return how many were added.
+
+        Into an empty tree the users are sorted by key and the tree is built
+        in O(n) after the sort by repeatedly taking the midpoint as the
+        subtree root, giving a perfectly balanced tree. Otherwise each user
+        goes through `insert_user`. Invalid users and duplicate usernames
+        are skipped (the first occurrence wins).
+        """
+        if self.root is not None:
+            before = self.size
+            for u in users:
+                self.insert_user(u)
+            return self.size - before
+        
+        norm = self._normalize
+        by_key = {}
+        for u in users:
+            uname = getattr(u, 'username', None)
+            if uname is None:
+                continue
+            by_key.setdefault(uname if norm is None else norm(uname), u)
+        items = sorted(by_key.items())
+        if not items:
+            return 0
+        
+        # Built in level order, so handing out priorities in descending order
+        # keeps every parent above its children and the result a valid treap.
+        priorities = sorted((random.random() for _ in items), reverse=True)
+        p = 0
+        root = None
+        queue = deque([(0, len(items) - 1, None, False)])
+        while queue:
+            lo, hi, parent, is_left = queue.popleft()
+            mid = (lo + hi) // 2
+            key, u = items[mid]
+            node = BSTNode(u, _intern_key(key), priorities[p])
+            p += 1
+            if parent is None:
+                root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            if lo < mid:
+                queue.append((lo, mid - 1, node, True))
+            if mid < hi:
+                queue.append((mid + 1, hi, node, False))
+        
+        self.root = root
+        self.size += len(items)
+        return len(items)
 
     def _insert(self, node, user_obj, key):
-        if node is None:
-            return BSTNode(user_obj)
+        """Insert `key` below `node` and return the new subtree root.
+
+        Returns None if `key` is already present, so the duplicate check
+        happens during the same descent as the insert.
+        """
+        path = []
+        while node is not None:
+            node_key = node.key
+            if key == node_key:
+                return None
+            path.append(node)
+            node = node.left if key < node_key else node.right
         
-        node_key = self._key(node.user.username)
-        if key < node_key:
-            node.left = self._insert(node.left, user_obj, key)
+        node = BSTNode(user_obj, _intern_key(key))
+        # Rotate the new node up while it outranks its parent
+        while path and path[-1].priority < node.priority:
+            parent = path.pop()
+            if key < parent.key:
+                parent.left = node.right
+                node.right = parent
+            else:
+                parent.right = node.left
+                node.left = parent
+        
+        if not path:
+            return node
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = node
         else:
-            node.right = self._insert(node.right, user_obj, key)
-        return node
+            parent.right = node
+        return path[0]
 
-    def find_user(self, username):
+    def _key(self, username):
+        """Normalized key for `username`, or None if `username` is None"""
         if username is None:
-            return "User not found"
+            return None
+        norm = self._normalize
+        return username if norm is None else norm(username)
+
+    def find_user(self, username):
         key = self._key(username)
+        if key is None:
+            return "User not found"
+        cache = self._find_cache
+        node = cache.get(key)
+        if node is not None:
+            cache.move_to_end(key)
+            return node.user.introduce()
         node = self._search(self.root, key)
-        return node.user.introduce() if node is not None else "User not found"
+        if node is None:
+            return "User not found"
+        cache[key] = node
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return node.user.introduce()
 
     def _search(self, node, key):
-        if node is None:
+        while node is not None:
+            node_key = node.key
+            if key == node_key:
+                return node
+            node = node.left if key < node_key else node.right
+        return None
+
+    def _lookup(self, username):
+        """Return the node for `username`, or None if absent"""
+        key = self._key(username)
+        if key is None:
             return None
-        node_key = self._key(node.user.username)
-        if key == node_key:
-            return node
-        elif key < node_key:
-            return self._search(node.left, key)
-        else:
-            return self._search(node.right, key)
+        return self._search(self.root, key)
+
+    def update(self, username, new_email):
+        node = self._lookup(username)
+        if node is None:
+            return "User not found"
+        u = node.user
+        u.email = new_email
+        u._intro = None
+        return f"User {u.username} email updated to {new_email}"
 
     def list_all_users(self):
-        result = []
+        # The size is known, so fill a preallocated list instead of appending
+        result = [None] * self.size
         self._inorder(self.root, result)
         return result
 
+    def iter_all_users(self):
+        """Yield each user's introduction lazily, in key order"""
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.user.introduce()
+            node = node.right
+
     def _inorder(self, node, result):
-        if node is not None:
-            self._inorder(node.left, result)
-            result.append(node.user.introduce())
-            self._inorder(node.right, result)
+        stack = []
+        i = 0
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            result[i] = node.user.introduce()
+            i += 1
+            node = node.right
+
+
+# 32 symbols, so every random byte maps onto the alphabet uniformly (256 % 32 == 0)
+_USERNAME_ALPHABET = (string.ascii_lowercase + "234567").encode("ascii")
+_USERNAME_TABLE = bytes(_USERNAME_ALPHABET[i % 32] for i in range(256))
 
 
 def generate_random_username(length=10):
-    """Generate random username for testing"""
-    return ''.join(random.choices(string.ascii_lowercase + string.digits, k=length))
+    """Generate random username for testing
+
+    Draws `length` random bytes and maps them onto the alphabet with a single
+    `bytes.translate`, keeping the per-character work in C.
+    """
+    return random.randbytes(length).translate(_USERNAME_TABLE).decode("ascii")
 
 
 def run_performance_tests():
@@ -210,64 +459,52 @@ def run_performance_tests():
         search_count = min(1000, size)
         search_usernames = random.sample(usernames, search_count)
         
-        # Test Linear Search (Dictionary)
-        linear_db = UserDatabase()
+        # Each phase is wrapped in a callable and timed with timeit: best of
+        # `repeat` runs, perf_counter only, nothing but the hot loop inside.
+        # Insert runs start from an empty database; BST search runs start with
+        # a cleared find_user cache so every run does real tree descents.
+        repeat = 5
         
-        # Insertion timing - perf_counter
-        start_perf = time.perf_counter()
-        start_time = time.time()
-        for u in users:
-            linear_db.insert_user(u)
-        linear_insert_perf = time.perf_counter() - start_perf
-        linear_insert_time = time.time() - start_time
+        def best_of(run, setup="pass"):
+            return min(timeit.Timer(run, setup=setup).repeat(repeat=repeat, number=1))
+        
+        # Users are known up front, so both databases load them in bulk
+        def linear_insert():
+            UserDatabase().bulk_insert(users)
         
-        # Search timing - perf_counter
-        start_perf = time.perf_counter()
-        start_time = time.time()
-        for username in search_usernames:
-            linear_db.find_user(username)
-        linear_search_perf = time.perf_counter() - start_perf
-        linear_search_time = time.time() - start_time
+        def bst_insert():
+            BSTUserDatabase().bulk_insert(users)
         
-        # Test BST
+        linear_db = UserDatabase()
+        linear_db.bulk_insert(users)
         bst_db = BSTUserDatabase()
+        bst_db.bulk_insert(users)
         
-        # Insertion timing
-        start_perf = time.perf_counter()
-        start_time = time.time()
-        for u in users:
-            bst_db.insert_user(u)
-        bst_insert_perf = time.perf_counter() - start_perf
-        bst_insert_time = time.time() - start_time
+        def linear_search():
+            find = linear_db.find_user
+            for username in search_usernames:
+                find(username)
+        
+        def bst_search():
+            find = bst_db.find_user
+            for username in search_usernames:
+                find(username)
         
-        # Search timing
-        start_perf = time.perf_counter()
-        start_time = time.time()
-        for username in search_usernames:
-            bst_db.find_user(username)
-        bst_search_perf = time.perf_counter() - start_perf
-        bst_search_time = time.time() - start_time
+        linear_insert_perf = best_of(linear_insert)
+        bst_insert_perf = best_of(bst_insert)
+        linear_search_perf = best_of(linear_search)
+        bst_search_perf = best_of(bst_search, setup=bst_db._find_cache.clear)
         
         # Display results
-        print(f"\n[INSERTION PERFORMANCE]")
-        print(f"   Linear (Dict):")
-        print(f"      time.perf_counter(): {linear_insert_perf*1000:8.2f} ms")
-        print(f"      time.time():         {linear_insert_time*1000:8.2f} ms")
-        print(f"   BST:")
-        print(f"      time.perf_counter(): {bst_insert_perf*1000:8.2f} ms")
-        print(f"      time.time():         {bst_insert_time*1000:8.2f} ms")
-        print(f"   Speedup (perf_counter): {linear_insert_perf/bst_insert_perf:8.2f}x {'(BST faster)' if bst_insert_perf < linear_insert_perf else '(Linear faster)'}")
-        print(f"   Speedup (time.time):    {linear_insert_time/bst_insert_time:8.2f}x {'(BST faster)' if bst_insert_time < linear_insert_time else '(Linear faster)'}")
+        print(f"\n[INSERTION PERFORMANCE] (best of {repeat})")
+        print(f"   Linear (Dict):          {linear_insert_perf*1000:8.2f} ms")
+        print(f"   BST:                    {bst_insert_perf*1000:8.2f} ms")
+        print(f"   Speedup:                {linear_insert_perf/bst_insert_perf:8.2f}x {'(BST faster)' if bst_insert_perf < linear_insert_perf else '(Linear faster)'}")
         
-        print(f"\n[SEARCH PERFORMANCE] ({search_count} searches)")
-        print(f"   Linear (Dict):")
-        print(f"      time.perf_counter(): {linear_search_perf*1000:8.2f} ms")
-        print(f"      time.time():         {linear_search_time*1000:8.2f} ms")
-        print(f"   BST:")
-        print(f"      time.perf_counter(): {bst_search_perf*1000:8.2f} ms")
-        print(f"      time.time():         {bst_search_time*1000:8.2f} ms")
-        print(f"   Speedup (perf_counter): {linear_search_perf/bst_search_perf:8.2f}x {'(BST faster)' if bst_search_perf < linear_search_perf else '(Linear faster)'}")
-        print(f"   Speedup (time.time):    {linear_search_time/bst_search_time:8.2f}x {'(BST faster)' if bst_search_time < linear_search_time else '(Linear faster)'}")
+        print(f"\n[SEARCH PERFORMANCE] ({search_count} searches, best of {repeat})")
+        print(f"   Linear (Dict):          {linear_search_perf*1000:8.2f} ms")
+        print(f"   BST:                    {bst_search_perf*1000:8.2f} ms")
+        print(f"   Speedup:                {linear_search_perf/bst_search_perf:8.2f}x {'(BST faster)' if bst_search_perf < linear_search_perf else '(Linear faster)'}")
         
         # Theoretical complexity
         linear_comparisons = size / 2  # Average for linear search
@@ -283,16 +520,12 @@ def run_performance_tests():
     print("WHY IS BINARY SEARCH TREE FASTER?")
     print('=' * 80)
     print("""
-TIMING METHODS EXPLAINED:
-- time.perf_counter(): High-resolution timer for performance measurement
-  * Best for benchmarking (more precise, monotonic)
-  * Measures actual CPU time spent
-  
-- time.time(): Wall-clock time (system time)
-  * Can be affected by system clock adjustments
-  * Less precise but shows real-world elapsed time
-
-Both methods show BST's superior performance!
+TIMING METHOD EXPLAINED:
+- timeit.Timer(...).repeat(): runs each phase several times and the
+  fastest run is reported
+  * Uses time.perf_counter(): high-resolution and monotonic
+  * The minimum is the run least disturbed by other system activity
+  * time.time() is not used: it is coarser and can jump with clock changes
 """)
     print("""
 1. DIVIDE AND CONQUER STRATEGY:
@@ -317,46 +550,196 @@ Both methods show BST's superior performance!
    - 1,000,000 items: Linear ~ 500K ops | BST ~ 20 ops  (25,000x faster!)
 
 WARNING: BST performance depends on tree balance. Worst case (unbalanced)
-         degrades to O(n), same as linear. Use self-balancing trees (AVL, Red-Black)
+         degrades to O(n), same as linear. BSTUserDatabase is a treap, so its
+         expected depth stays O(log n); use AVL or Red-Black trees
          for guaranteed O(log n) performance in production systems.
 """)
 
 
 def build_tree(tup):
-    """Build tree from nested tuple representation"""
-    if isinstance(tup, tuple) and len(tup) == 3:
-        node = TreeNode(tup[1])
-        node.left = build_tree(tup[0])
-        node.right = build_tree(tup[2])
-    elif tup is None:
-        node = None
-    else:
-        node = TreeNode(tup)
-    return node
+    """Build tree from nested tuple representation
+
+    Iterative: each stack frame is `(parent, is_left, subtuple)`, so a node is
+    created and attached to its parent in one step, before its children.
+    """
+    holder = TreeNode(None)  # placeholder parent; the root hangs off its left
+    stack = [(holder, True, tup)]
+    while stack:
+        parent, is_left, item = stack.pop()
+        if item is None:
+            continue
+        if isinstance(item, tuple) and len(item) == 3:
+            node = TreeNode(item[1])
+            stack.append((node, False, item[2]))
+            stack.append((node, True, item[0]))
+        else:
+            node = TreeNode(item)
+        if is_left:
+            parent.left = node
+        else:
+            parent.right = node
+    return holder.left
 
 
 def tree_to_tuple(node):
-    """Convert tree back to nested tuple representation"""
+    """Convert tree back to nested tuple representation
+
+    Iterative post-order: a node's tuple is assembled from the two child
+    results on top of the result stack.
+    """
     if node is None:
         return None
-    if node.left is None and node.right is None:
-        return node.key
-    left = tree_to_tuple(node.left)
-    right = tree_to_tuple(node.right)
-    return (left, node.key, right)
+    result = []
+    stack = [(node, False)]
+    while stack:
+        n, children_done = stack.pop()
+        if n is None:
+            result.append(None)
+        elif n.left is None and n.right is None:
+            result.append(n.key)
+        elif children_done:
+            right = result.pop()
+            left = result.pop()
+            result.append((left, n.key, right))
+        else:
+            stack.append((n, True))
+            stack.append((n.right, False))
+            stack.append((n.left, False))
+    return result[0]
+
+
+class _EmptySlot:
+    """Marker for an unused ArrayTree slot, distinct from a None key"""
+    __slots__ = ()
+
+    def __repr__(self):
+        return "*"
+
+
+_EMPTY = _EmptySlot()
+
+
+class ArrayTree:
+    """Binary tree stored flat in heap order instead of as linked TreeNodes.
+
+    The key of slot `i` lives at `keys[i]`, its children at `2*i + 1` and
+    `2*i + 2`, and empty slots hold a private marker (shown as `*`), so None
+    is still a valid key. There is no per-node object and
+    traversal is index arithmetic over one list. Skewed trees would leave
+    most slots empty, so when fewer than a quarter of the slots are used the
+    keys go into a `{slot: key}` dict instead.
+    """
+    __slots__ = ('keys',)
+
+    def __init__(self, keys=None):
+        self.keys = keys if keys is not None else []
+
+    @classmethod
+    def from_tuple(cls, tup):
+        """Build from the nested tuple representation used by build_tree"""
+        slots = {}
+        stack = [(0, tup)]
+        while stack:
+            i, item = stack.pop()
+            if item is None:
+                continue
+            if isinstance(item, tuple) and len(item) == 3:
+                slots[i] = item[1]
+                stack.append((2 * i + 1, item[0]))
+                stack.append((2 * i + 2, item[2]))
+            else:
+                slots[i] = item
+        if not slots:
+            return cls()
+        size = max(slots) + 1
+        if size > 4 * len(slots):
+            return cls(slots)
+        keys = [_EMPTY] * size
+        for i, key in slots.items():
+            keys[i] = key
+        return cls(keys)
+
+    def key_at(self, i, default=None):
+        """Key stored in slot `i`, or `default` if the slot is empty"""
+        keys = self.keys
+        if type(keys) is dict:
+            key = keys.get(i, _EMPTY)
+        else:
+            key = keys[i] if i < len(keys) else _EMPTY
+        return default if key is _EMPTY else key
+
+    def to_tuple(self):
+        """Convert back to the nested tuple representation (iterative post-order)"""
+        if self.key_at(0, _EMPTY) is _EMPTY:
+            return None
+        key_at = self.key_at
+        result = []
+        stack = [(0, False)]
+        while stack:
+            i, children_done = stack.pop()
+            key = key_at(i, _EMPTY)
+            if key is _EMPTY:
+                result.append(None)
+            elif key_at(2 * i + 1, _EMPTY) is _EMPTY and key_at(2 * i + 2, _EMPTY) is _EMPTY:
+                result.append(key)
+            elif children_done:
+                right = result.pop()
+                left = result.pop()
+                result.append((left, key, right))
+            else:
+                stack.append((i, True))
+                stack.append((2 * i + 2, False))
+                stack.append((2 * i + 1, False))
+        return result[0]
+
+    def display_keys_lines(self, space="\t", level=0):
+        """Same lines as display_keys_lines() for the equivalent TreeNode tree"""
+        key_at = self.key_at
+        lines = []
+        stack = [(0, level, False)]
+        while stack:
+            i, lvl, expanded = stack.pop()
+            key = key_at(i, _EMPTY)
+            if key is _EMPTY:
+                lines.append(space * lvl + "*")
+            elif expanded or (key_at(2 * i + 1, _EMPTY) is _EMPTY
+                              and key_at(2 * i + 2, _EMPTY) is _EMPTY):
+                lines.append(space * lvl + str(key))
+            else:
+                # Right subtree comes first, then the node, then the left
+                stack.append((2 * i + 1, lvl + 1, False))
+                stack.append((i, lvl, True))
+                stack.append((2 * i + 2, lvl + 1, False))
+        return lines
+
+    def display_keys(self, space="\t", level=0):
+        """Same output as display_keys() for the equivalent TreeNode tree"""
+        sys.stdout.write("\n".join(self.display_keys_lines(space, level)) + "\n")
+
+
+def display_keys_lines(node, space="\t", level=0):
+    """Return the lines display_keys would print, right subtree first"""
+    lines = []
+    stack = [(node, level, False)]
+    while stack:
+        n, lvl, expanded = stack.pop()
+        if n is None:
+            lines.append(space * lvl + "*")
+        elif expanded or (n.left is None and n.right is None):
+            lines.append(space * lvl + str(n.key))
+        else:
+            stack.append((n.left, lvl + 1, False))
+            stack.append((n, lvl, True))
+            stack.append((n.right, lvl + 1, False))
+    return lines
 
 
 def display_keys(node, space="\t", level=0):
-    """Display tree structure visually (rotated 90 degrees clockwise)"""
-    if node is None:
-        print(space * level + "*")
-        return
-    if node.left is None and node.right is None:
-        print(space * level + str(node.key))
-        return
-    display_keys(node.right, space, level + 1)
-    print(space * level + str(node.key))
-    display_keys(node.left, space, level + 1)
+    """Display tree structure visually (rotated 90 degrees clockwise)
+
+    The lines are built first and written to stdout in a single call.
+    """
+    sys.stdout.write("\n".join(display_keys_lines(node, space, level)) + "\n")
 
 
 def display_tree_pretty(node, prefix="", is_tail=True):
@@ -440,10 +823,20 @@ def display_tree_compact(node, indent="", last=True):
 
 
 def get_tree_height(node):
-    """Calculate the height of the tree"""
+    """Calculate the height of the tree (level-order, no recursion)"""
     if node is None:
         return 0
-    return 1 + max(get_tree_height(node.left), get_tree_height(node.right))
+    height = 0
+    queue = deque([(node, 1)])
+    while queue:
+        n, depth = queue.popleft()
+        if depth > height:
+            height = depth
+        if n.left is not None:
+            queue.append((n.left, depth + 1))
+        if n.right is not None:
+            queue.append((n.right, depth + 1))
+    return height
 
 
 def get_tree_info(node):
@@ -451,16 +844,19 @@ def get_tree_info(node):
     if node is None:
         return {"height": 0, "nodes": 0, "leaves": 0}
     
-    def count_nodes(n):
-        if n is None:
-            return 0, 0  # (total_nodes, leaf_nodes)
+    total, leaves = 0, 0
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        total += 1
         if n.left is None and n.right is None:
-            return 1, 1  # Leaf node
-        left_total, left_leaves = count_nodes(n.left)
-        right_total, right_leaves = count_nodes(n.right)
-        return 1 + left_total + right_total, left_leaves + right_leaves
+            leaves += 1  # Leaf node
+            continue
+        if n.left is not None:
+            stack.append(n.left)
+        if n.right is not None:
+            stack.append(n.right)
     
-    total, leaves = count_nodes(node)
     return {
         "height": get_tree_height(node),
         "nodes": total,
@@ -530,5 +926,9 @@ if __name__ == "__main__":
     print(f"Reconstructed: {reconstructed}")
     print(f"Match: {reconstructed == tree_tuple}")
     
+    array_tree = ArrayTree.from_tuple(tree_tuple)
+    print(f"\nArrayTree slots: {array_tree.keys}")
+    print(f"ArrayTree match: {array_tree.to_tuple() == tree_tuple}")
+    
     # Display tree with all visualization styles
     visualize_tree_all_styles(root, "Binary Tree Example")
\ No newline at end of file